@@ -3,6 +3,9 @@ from utils import *
 
 
 def main():
+    probs, labels = make_dataset(500, 500, (0.6, 0.01), (0.2, 0.01))
+    roc_counts = make_roc_counts(probs, labels)
+
     st.write(
         """
     # What is AUC-ROC?
@@ -102,18 +105,8 @@ def main():
         classification model.
     """
     )
-    m, n = 1000, 100
-    some_rand_input = np.random.rand(m, n)
-    labels = np.hstack(
-        [
-            np.ones(int(np.ceil(m / 2))).astype(np.uint8),
-            np.zeros(m // 2).astype(np.uint8),
-        ]
-    )
     threshold = 0.5
-    clf = DummyClassifier(pos_label_args=(0.6, 0.01), neg_label_args=(0.2, 0.01))
-    probs = clf.predict(some_rand_input, y=labels)
-    plot1(probs, labels, threshold)
+    plot1(probs, labels, threshold, roc_counts=roc_counts)
 
     st.write(
         """
@@ -149,30 +142,25 @@ def main():
     )
     st.latex(r"FPR = \frac {FP} {TN + FP}")
 
-    m, n = 1000, 100
-    some_rand_input = np.random.rand(m, n)
-    labels = np.hstack(
-        [
-            np.ones(int(np.ceil(m / 2))).astype(np.uint8),
-            np.zeros(m // 2).astype(np.uint8),
-        ]
-    )
-    clf = DummyClassifier(pos_label_args=(0.6, 0.01), neg_label_args=(0.2, 0.01))
-    probs = clf.predict(some_rand_input, y=labels)
-
-    # Create a slider input
-    slider_value = st.slider(
-        "Select a threshold", min_value=0.0, max_value=1.0, step=0.02, format="%.2f"
-    )
-
-    def f1(threshold=0):
-        confusion_matrix = plot1(probs, labels, threshold)
+    @st.fragment
+    def f1():
+        # Create a slider input
+        slider_value = st.slider(
+            "Select a threshold",
+            min_value=0.0,
+            max_value=1.0,
+            step=0.02,
+            format="%.2f",
+        )
+        confusion_matrix = plot1(
+            probs, labels, slider_value, key="plot1_cm", roc_counts=roc_counts
+        )
         fn, tp = confusion_matrix[1]
         tn, fp = confusion_matrix[0]
         st.write(f"TPR: {tp / (tp + fn + 1e-20)}")
         st.write(f"FPR: {fp / (fp + tn + 1e-20)}")
 
-    f1(slider_value)
+    f1()
 
     st.write(
         """
@@ -247,26 +235,31 @@ def main():
     """
     )
 
-    m, n = 1000, 100
-    some_rand_input = np.random.rand(m, n)
-    labels = np.hstack(
-        [
-            np.ones(int(np.ceil(m / 2))).astype(np.uint8),
-            np.zeros(m // 2).astype(np.uint8),
-        ]
-    )
-    clf = DummyClassifier(pos_label_args=(0.6, 0.01), neg_label_args=(0.2, 0.01))
-    probs = clf.predict(some_rand_input, y=labels)
-
-    tpr, fpr = make_tpr_fpr(probs, labels)
-
-    def f2(threshold=0):
-        plot2(probs, labels, tpr, fpr, threshold, area=True)
-
-    slider_value1 = st.slider(
-        "Select a threshold", min_value=0.0, max_value=1.0, step=0.1, format="%.1f"
-    )
-    f2(slider_value1)
+    tpr, fpr, thresholds = make_tpr_fpr(probs, labels)
+    auc = fast_auc(probs, labels)
+
+    @st.fragment
+    def f2():
+        slider_value1 = st.slider(
+            "Select a threshold",
+            min_value=0.0,
+            max_value=1.0,
+            step=0.1,
+            format="%.1f",
+        )
+        plot2(
+            probs,
+            labels,
+            tpr,
+            fpr,
+            thresholds,
+            slider_value1,
+            area=True,
+            auc=auc,
+            key="plot2_roc",
+        )
+
+    f2()
 
     st.write(
         """
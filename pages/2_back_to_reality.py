@@ -1,5 +1,4 @@
 import streamlit as st
-import numpy as np
 from utils import *
 
 
@@ -16,31 +15,34 @@ def main():
     """
     )
 
-    m, n = 1000, 100
-    some_rand_input = np.random.rand(m, n)
-    labels = np.hstack(
-        [
-            np.ones(int(np.ceil(m / 2))).astype(np.uint8),
-            np.zeros(m // 2).astype(np.uint8),
-        ]
-    )
-    clf = DummyClassifier(pos_label_args=(0.65, 0.15), neg_label_args=(0.35, 0.15))
-    probs = clf.predict(some_rand_input, y=labels)
+    probs, labels = make_dataset(500, 500, (0.65, 0.15), (0.35, 0.15))
 
-    tpr, fpr = make_tpr_fpr(probs, labels)
+    tpr, fpr, thresholds = make_tpr_fpr(probs, labels)
+    auc = fast_auc(probs, labels)
 
-    def f(threshold=0):
-        plot2(probs, labels, tpr, fpr, threshold, area=True)
+    @st.fragment
+    def f():
+        slider_value3 = st.slider(
+            "Select a threshold",
+            min_value=0.0,
+            max_value=1.0,
+            step=0.1,
+            format="%.1f",
+            key="slider3",
+        )
+        plot2(
+            probs,
+            labels,
+            tpr,
+            fpr,
+            thresholds,
+            slider_value3,
+            area=True,
+            auc=auc,
+            key="back_to_reality_roc",
+        )
 
-    slider_value3 = st.slider(
-        "Select a threshold",
-        min_value=0.0,
-        max_value=1.0,
-        step=0.1,
-        format="%.1f",
-        key="slider3",
-    )
-    f(slider_value3)
+    f()
 
     st.write(
         """
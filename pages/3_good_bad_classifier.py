@@ -1,5 +1,4 @@
 import streamlit as st
-import numpy as np
 from utils import *
 
 
@@ -23,68 +22,67 @@ def main():
         """
     )
 
-    positive_mean = st.slider(
-        "Positive Mean",
-        min_value=0.0,
-        max_value=1.0,
-        step=0.1,
-        format="%.1f",
-        key="positive_mean",
-        value=0.7,
-    )
-    positive_std = st.slider(
-        "Positive Std.",
-        min_value=0.0,
-        max_value=0.5,
-        step=0.01,
-        format="%.2f",
-        key="positive_std",
-        value=0.1,
-    )
-    negative_mean = st.slider(
-        "Negative Mean",
-        min_value=0.0,
-        max_value=1.0,
-        step=0.1,
-        format="%.1f",
-        key="negative_mean",
-        value=0.3,
-    )
-    negative_std = st.slider(
-        "Negative Std.",
-        min_value=0.0,
-        max_value=0.5,
-        step=0.01,
-        format="%.2f",
-        key="negative_std",
-        value=0.1,
-    )
-
-    m, n = 1000, 100
-    some_rand_input = np.random.rand(m, n)
-    labels = np.hstack(
-        [
-            np.ones(int(np.ceil(m / 2))).astype(np.uint8),
-            np.zeros(m // 2).astype(np.uint8),
-        ]
-    )
+    @st.fragment
+    def f():
+        positive_mean = st.slider(
+            "Positive Mean",
+            min_value=0.0,
+            max_value=1.0,
+            step=0.1,
+            format="%.1f",
+            key="positive_mean",
+            value=0.7,
+        )
+        positive_std = st.slider(
+            "Positive Std.",
+            min_value=0.0,
+            max_value=0.5,
+            step=0.01,
+            format="%.2f",
+            key="positive_std",
+            value=0.1,
+        )
+        negative_mean = st.slider(
+            "Negative Mean",
+            min_value=0.0,
+            max_value=1.0,
+            step=0.1,
+            format="%.1f",
+            key="negative_mean",
+            value=0.3,
+        )
+        negative_std = st.slider(
+            "Negative Std.",
+            min_value=0.0,
+            max_value=0.5,
+            step=0.01,
+            format="%.2f",
+            key="negative_std",
+            value=0.1,
+        )
 
-    def f(
-        pos_label_mean=0.5,
-        pos_label_std=0.1,
-        neg_label_mean=0.5,
-        neg_label_std=0.1,
-    ):
         threshold = 0.5
-        clf = DummyClassifier(
-            pos_label_args=(pos_label_mean, pos_label_std),
-            neg_label_args=(neg_label_mean, neg_label_std),
+        probs, labels = make_dataset(
+            500,
+            500,
+            pos_label_args=(positive_mean, positive_std),
+            neg_label_args=(negative_mean, negative_std),
+        )
+        tpr, fpr, thresholds = make_tpr_fpr(probs, labels)
+        auc = fast_auc(probs, labels)
+        plot2(
+            probs,
+            labels,
+            tpr,
+            fpr,
+            thresholds,
+            threshold,
+            area=True,
+            auc=auc,
+            key="good_bad_roc",
         )
-        probs = clf.predict(some_rand_input, y=labels)
-        tpr, fpr = make_tpr_fpr(probs, labels)
-        plot2(probs, labels, tpr, fpr, threshold, area=True)
 
-    f(positive_mean, positive_std, negative_mean, negative_std)
+    f()
 
     st.write(
         """
@@ -1,6 +1,5 @@
 import streamlit as st
 import numpy as np
-from sklearn.metrics import roc_auc_score, accuracy_score
 from utils import *
 
 
@@ -32,18 +31,15 @@ def main():
     and appropriate for our specific needs.
     """
     )
-    m, n = 1100, 100
-    some_rand_input = np.random.rand(m, n)
-    labels = np.hstack([np.ones(100).astype(np.uint8), np.zeros(1000).astype(np.uint8)])
-    clf = DummyClassifier(pos_label_args=(0.70, 0.1), neg_label_args=(0.3, 0.1))
-    probs = clf.predict(some_rand_input, y=labels)
+    probs, labels = make_dataset(100, 1000, (0.70, 0.1), (0.3, 0.1))
 
-    tpr, fpr = make_tpr_fpr(probs, labels)
+    tpr, fpr, thresholds = make_tpr_fpr(probs, labels)
+    auc_roc1 = fast_auc(probs, labels)
 
     st.write(
         "Let's see how does model output distribution looks for a good classifier."
     )
-    plot2(probs, labels, tpr, fpr, threshold=0.5, area=True)
+    plot2(probs, labels, tpr, fpr, thresholds, threshold=0.5, area=True, auc=auc_roc1)
 
     st.write(
         "Look how we have some threshold, that can do a good job \
@@ -51,12 +47,10 @@ def main():
     )
 
     st.write("Compute Accuracy and AUC-ROC")
-    auc_roc1 = roc_auc_score(labels, probs)
-
     max_acc1 = (0, 0)
     for t in range(0, 11, 1):
         t = t / 10
-        acc = accuracy_score(labels, (probs >= t).astype(np.uint8))
+        acc = np.mean(labels == (probs >= t))
         if max_acc1[0] < acc:
             max_acc1 = (acc, t)
 
@@ -65,18 +59,16 @@ def main():
     st.markdown("---")
 
     st.write("Let's See how it is for a bad classifier")
-    clf = DummyClassifier(pos_label_args=(0.60, 0.15), neg_label_args=(0.4, 0.15))
-    probs = clf.predict(some_rand_input, y=labels)
-
-    tpr, fpr = make_tpr_fpr(probs, labels)
-    plot2(probs, labels, tpr, fpr, threshold=0.5, area=True)
+    probs, labels = make_dataset(100, 1000, (0.60, 0.15), (0.4, 0.15))
 
-    auc_roc2 = roc_auc_score(labels, probs)
+    tpr, fpr, thresholds = make_tpr_fpr(probs, labels)
+    auc_roc2 = fast_auc(probs, labels)
+    plot2(probs, labels, tpr, fpr, thresholds, threshold=0.5, area=True, auc=auc_roc2)
 
     max_acc2 = (0, 0)
     for t in range(0, 11, 1):
         t = t / 10
-        acc = accuracy_score(labels, (probs >= t).astype(np.uint8))
+        acc = np.mean(labels == (probs >= t))
         if max_acc2[0] < acc:
             max_acc2 = (acc, t)
 
@@ -101,20 +93,16 @@ def main():
     )
 
     st.write("## What if we have more positive samples than negative")
-    m, n = 1100, 100
-    some_rand_input = np.random.rand(m, n)
-    labels = np.hstack([np.ones(1000).astype(np.uint8), np.zeros(100).astype(np.uint8)])
-    clf = DummyClassifier(pos_label_args=(0.60, 0.15), neg_label_args=(0.4, 0.15))
-    probs = clf.predict(some_rand_input, y=labels)
+    probs, labels = make_dataset(1000, 100, (0.60, 0.15), (0.4, 0.15))
 
-    tpr, fpr = make_tpr_fpr(probs, labels)
-    plot2(probs, labels, tpr, fpr, threshold=0.5, area=True)
-    auc_roc = roc_auc_score(labels, probs)
+    tpr, fpr, thresholds = make_tpr_fpr(probs, labels)
+    auc_roc = fast_auc(probs, labels)
+    plot2(probs, labels, tpr, fpr, thresholds, threshold=0.5, area=True, auc=auc_roc)
 
     max_acc = (0, 0)
     for t in range(0, 11, 1):
         t = t / 10
-        acc = accuracy_score(labels, (probs >= t).astype(np.uint8))
+        acc = np.mean(labels == (probs >= t))
         if max_acc[0] < acc:
             max_acc = (acc, t)
 
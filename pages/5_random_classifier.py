@@ -1,5 +1,4 @@
 import streamlit as st
-import numpy as np
 from utils import *
 
 
@@ -13,20 +12,12 @@ def main():
         classifier, what does it mean? Now consider the following example.
         """
     )
-    m, n = 1000, 100
-    some_rand_input = np.random.rand(m, n)
-    labels = np.hstack(
-        [
-            np.ones(int(np.ceil(m / 2))).astype(np.uint8),
-            np.zeros(m // 2).astype(np.uint8),
-        ]
-    )
-    clf = DummyClassifier(pos_label_args=(0.5, 0.1), neg_label_args=(0.5, 0.1))
-    probs = clf.predict(some_rand_input, y=labels)
+    probs, labels = make_dataset(500, 500, (0.5, 0.1), (0.5, 0.1))
 
-    tpr, fpr = make_tpr_fpr(probs, labels)
+    tpr, fpr, thresholds = make_tpr_fpr(probs, labels)
+    auc = fast_auc(probs, labels)
 
-    plot2(probs, labels, tpr, fpr, threshold=0.5, area=True)
+    plot2(probs, labels, tpr, fpr, thresholds, threshold=0.5, area=True, auc=auc)
 
     st.write(
         """
@@ -1,5 +1,4 @@
 import streamlit as st
-import numpy as np
 from utils import *
 
 
@@ -19,28 +18,34 @@ def main():
             For me, it would be 0.4 or 0.5. What do you think?
         """
     )
-    m, n = 10000, 100
-    some_rand_input = np.random.rand(m, n)
-    labels = np.hstack(
-        [np.ones(m // 2).astype(np.uint8), np.zeros(m // 2).astype(np.uint8)]
-    )
-    clf = DummyClassifier(pos_label_args=(0.60, 0.15), neg_label_args=(0.4, 0.15))
-    probs = clf.predict(some_rand_input, y=labels)
-
-    tpr, fpr = make_tpr_fpr(probs, labels)
-
-    def f(threshold):
-        plot2(probs, labels, tpr, fpr, threshold, area=True)
-
-    slider_value6 = st.slider(
-        "Select a threshold",
-        min_value=0.0,
-        max_value=1.0,
-        step=0.1,
-        format="%.1f",
-        key="selecting_optimal_threshold",
-    )
-    f(slider_value6)
+    probs, labels = make_dataset(5000, 5000, (0.60, 0.15), (0.4, 0.15))
+
+    tpr, fpr, thresholds = make_tpr_fpr(probs, labels)
+    auc = fast_auc(probs, labels)
+
+    @st.fragment
+    def f():
+        slider_value6 = st.slider(
+            "Select a threshold",
+            min_value=0.0,
+            max_value=1.0,
+            step=0.1,
+            format="%.1f",
+            key="selecting_optimal_threshold",
+        )
+        plot2(
+            probs,
+            labels,
+            tpr,
+            fpr,
+            thresholds,
+            slider_value6,
+            area=True,
+            auc=auc,
+            key="optimal_threshold_roc",
+        )
+
+    f()
 
 
 st.set_page_config(page_title="Optimal Threshold")
@@ -1,9 +1,13 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from typing import Tuple
+from typing import List, Optional, Tuple
 from plotly.subplots import make_subplots
 
+# The caches are shared by every session and page 3 feeds its sliders into
+# them, so keep only the most recent results instead of growing without limit
+CACHE_MAX_ENTRIES = 64
+
 
 class DummyClassifier:
     def __init__(
@@ -12,125 +16,174 @@ class DummyClassifier:
         self.pos_label_mean, self.pos_label_std = pos_label_args
         self.neg_label_mean, self.neg_label_std = neg_label_args
 
-    def predict(self, X: np.ndarray, y: np.ndarray) -> np.ndarray:
-        assert X.ndim == 2
-        m, n = X.shape
-        np.random.seed(40)
-        postives = (
-            np.random.randn(y[y == 1].shape[0]) * self.pos_label_std
-            + self.pos_label_mean
-        )
-        np.random.seed(40)
-        negatives = (
-            np.random.randn(y[y == 0].shape[0]) * self.neg_label_std
-            + self.neg_label_mean
+    def predict(self, y: np.ndarray) -> np.ndarray:
+        z = np.random.default_rng(40).standard_normal(y.shape[0])
+        # Scale per sample so the output lines up with y whatever its order
+        return np.where(
+            y == 1,
+            z * self.pos_label_std + self.pos_label_mean,
+            z * self.neg_label_std + self.neg_label_mean,
         )
-        return np.concatenate([postives, negatives], axis=-1)
 
 
-def plot1(
-    probabilities: np.ndarray, labels: np.ndarray, threshold: float
-) -> np.ndarray:
-    confusion_matrix = [[0, 0], [0, 0]]
-    for actual, predicted in zip(labels, (probabilities >= threshold).astype(np.uint8)):
-        confusion_matrix[actual][predicted] += 1
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def make_dataset(
+    num_pos: int,
+    num_neg: int,
+    pos_label_args: Tuple[float, float],
+    neg_label_args: Tuple[float, float],
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Inputs never change between reruns, so build them once per arguments
+    labels = np.repeat(np.array([1, 0], dtype=np.uint8), [num_pos, num_neg])
+    clf = DummyClassifier(pos_label_args=pos_label_args, neg_label_args=neg_label_args)
+    probs = clf.predict(labels)
+    return probs, labels
 
-    fig = make_subplots(rows=2, cols=1)
-    fig.add_trace(
-        go.Histogram(x=probabilities[labels == 1], name="Positive Labels", nbinsx=100),
-        row=1,
-        col=1,
-    )
-    fig.add_trace(
-        go.Histogram(x=probabilities[labels == 0], name="Negatives Labels", nbinsx=100),
-        row=1,
-        col=1,
-    )
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def make_histograms(
+    probabilities: np.ndarray, labels: np.ndarray, bins: int = 100
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Bin on our side so only the counts are sent to the browser
+    edges = np.histogram_bin_edges(probabilities, bins=bins)
+    pos_counts, _ = np.histogram(probabilities[labels == 1], bins=edges)
+    neg_counts, _ = np.histogram(probabilities[labels == 0], bins=edges)
+    centers = (edges[:-1] + edges[1:]) / 2
+    return centers, pos_counts, neg_counts
+
+
+def build_fig1(probabilities: np.ndarray, labels: np.ndarray) -> go.Figure:
+    # Everything that does not depend on the threshold
+    centers, pos_counts, neg_counts = make_histograms(probabilities, labels)
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=centers, y=pos_counts, name="Positive Labels"))
+    fig.add_trace(go.Bar(x=centers, y=neg_counts, name="Negatives Labels"))
     fig["layout"]["xaxis"]["title"] = "Model Output Probabilities"
     fig["layout"]["yaxis"]["title"] = "Num Counts"
-    # Add vertical line at the threshold
+    # Vertical line at the threshold, moved by plot1
     fig.add_shape(
         type="line",
-        x0=threshold,
-        x1=threshold,
+        x0=0,
+        x1=0,
         y0=0,
         y1=len(labels) / 10,
         line=dict(color="lightgray", dash="dot"),
     )
-    text = [["TN: ", "FP: "], ["FN: ", "TP: "]]
-    for i in range(2):
-        for j in range(2):
-            text[i][j] += str(confusion_matrix[i][j])
-    # Create the confusion matrix plot
-    fig.add_trace(
-        go.Heatmap(
-            z=confusion_matrix,
-            x=["Predicted negative", "Predicted positive"],
-            y=["Actual negative", "Actual positive"],
-            colorscale="gray",
-            showscale=False,
-            reversescale=True,
-            text=text,
-            hoverinfo="text",
-            texttemplate="%{text}",
-            textfont={"size": 20},
-        ),
-        row=2,
-        col=1,
-    )
-    fig.update_layout(
-        title_text=f"Histogram Plot and Confusion matrix for thershold = {threshold}",
-        width=800,
-        height=800,
-    )
-    st.plotly_chart(fig)
+    fig.update_layout(bargap=0, height=400)
+    return fig
+
+
+def plot1_metrics(confusion_matrix: List[List[int]]) -> None:
+    # Four plain numbers do not need a plotly heatmap
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("TN", confusion_matrix[0][0])
+    c2.metric("FP", confusion_matrix[0][1])
+    c3.metric("FN", confusion_matrix[1][0])
+    c4.metric("TP", confusion_matrix[1][1])
+
+
+def plot1(
+    probabilities: np.ndarray,
+    labels: np.ndarray,
+    threshold: float,
+    key: Optional[str] = None,
+    roc_counts: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+) -> List[List[int]]:
+    # Read the counts off the ROC instead of rescanning the scores, callers
+    # with a slider pass roc_counts in to skip the cache lookup on every tick
+    if roc_counts is None:
+        roc_counts = make_roc_counts(probabilities, labels)
+    tp, fp, thresholds = roc_counts
+    i = threshold_index(thresholds, threshold)
+    fn, tn = tp[-1] - tp[i], fp[-1] - fp[i]
+    confusion_matrix = [[int(tn), int(fp[i])], [int(fn), int(tp[i])]]
+
+    fig = build_fig1(probabilities, labels)
+    fig.layout.shapes[0].update(x0=threshold, x1=threshold)
+    fig.update_layout(title_text=f"Histogram Plot for threshold = {threshold}")
+    st.plotly_chart(fig, key=key, use_container_width=True)
+    st.write("Confusion matrix")
+    plot1_metrics(confusion_matrix)
     return confusion_matrix
 
 
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def make_roc_counts(
+    probabilities: np.ndarray, labels: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Sort scores once, every distinct score is a threshold on the ROC curve
+    order = np.argsort(-probabilities, kind="stable")
+    scores = probabilities[order]
+    actual = labels[order] == 1
+    last = np.flatnonzero(np.r_[scores[1:] != scores[:-1], True])
+    tp = np.cumsum(actual)[last]
+    # Everything above a threshold that is not a true positive is a false one
+    fp = last + 1 - tp
+    # Prepend the point where nothing is predicted positive
+    thresholds = np.r_[np.inf, scores[last]]
+    return np.r_[0, tp], np.r_[0, fp], thresholds
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
 def make_tpr_fpr(
     probabilities: np.ndarray, labels: np.ndarray
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-    # Data for the AUC-ROC curve
-    fpr = []
-    tpr = []
-    for t in range(11):
-        t = t / 10
-        confusion_matrix = [[0, 0], [0, 0]]
-        for actual, predicted in zip(labels, (probabilities >= t).astype(np.uint8)):
-            confusion_matrix[actual][predicted] += 1
-        fn, tp = confusion_matrix[1]
-        tn, fp = confusion_matrix[0]
-        tpr.append(tp / (tp + fn + 1e-20))
-        fpr.append(fp / (fp + tn + 1e-20))
-    return np.array(tpr), np.array(fpr)
+    tp, fp, thresholds = make_roc_counts(probabilities, labels)
+    tpr = tp / (tp[-1] + 1e-20)
+    fpr = fp / (fp[-1] + 1e-20)
+    return tpr, fpr, thresholds
 
 
-def plot2(
+def threshold_index(thresholds: np.ndarray, threshold: float) -> int:
+    # thresholds are decreasing, pick the last one still >= threshold
+    return int(np.searchsorted(-thresholds, -threshold, side="right")) - 1
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def fast_auc(probabilities: np.ndarray, labels: np.ndarray) -> float:
+    # Mann-Whitney U statistic, i.e. the chance a positive outranks a negative
+    _, inverse, counts = np.unique(
+        probabilities, return_inverse=True, return_counts=True
+    )
+    # Tied scores share the average of the ranks they span
+    ranks = (np.cumsum(counts) - (counts - 1) / 2)[inverse]
+    num_pos = (labels == 1).sum()
+    num_neg = labels.size - num_pos
+    u = ranks[labels == 1].sum() - num_pos * (num_pos + 1) / 2
+    return u / (num_pos * num_neg)
+
+
+def build_fig2(
     probabilities: np.ndarray,
     labels: np.ndarray,
     tpr: np.ndarray,
     fpr: np.ndarray,
-    threshold: float,
     area: bool = False,
-) -> np.ndarray:
+    auc: Optional[float] = None,
+) -> go.Figure:
+    # Everything that does not depend on the threshold
+    title = "Prob distribution and ROC curve"
+    if auc is not None:
+        title += f" (AUC = {auc:.3f})"
+    centers, pos_counts, neg_counts = make_histograms(probabilities, labels)
     fig = make_subplots(rows=2, cols=1)
     fig.add_trace(
-        go.Histogram(x=probabilities[labels == 1], name="Positive labels", nbinsx=100),
+        go.Bar(x=centers, y=pos_counts, name="Positive labels"),
         row=1,
         col=1,
     )
     fig.add_trace(
-        go.Histogram(x=probabilities[labels == 0], name="Negative labels", nbinsx=100),
+        go.Bar(x=centers, y=neg_counts, name="Negative labels"),
         row=1,
         col=1,
     )
     fig["layout"]["xaxis"]["title"] = "Model Output Probabilities"
     fig["layout"]["yaxis"]["title"] = "Num Counts"
-    # Add vertical line at the threshold
+    # Vertical line at the threshold, moved by plot2
     fig.add_shape(
         type="line",
-        x0=threshold,
-        x1=threshold,
+        x0=0,
+        x1=0,
         y0=0,
         y1=len(labels) / 10,
         line=dict(color="lightgray", dash="dot"),
@@ -150,12 +203,10 @@ def plot2(
             go.Scatter(x=fpr, y=tpr, mode="lines", name="ROC Curve"), row=2, col=1
         )
 
-    n = len(tpr)
-    rand_series = np.arange(n) / 10
     fig.add_trace(
         go.Scatter(
-            x=rand_series,
-            y=rand_series,
+            x=[0, 1],
+            y=[0, 1],
             mode="lines",
             name="Random Classifier",
             line=dict(color="gray", dash="dot"),
@@ -165,18 +216,36 @@ def plot2(
     )
 
     fig.update_layout(
-        title="Prob distribution and ROC curve",
+        title=title,
         xaxis2=dict(title="FPR"),
         yaxis2=dict(title="TPR"),
         xaxis2_range=[0, 1],
         yaxis2_range=[0, 1],
         showlegend=True,
+        bargap=0,
         height=800,
     )
+    return fig
+
+
+def plot2(
+    probabilities: np.ndarray,
+    labels: np.ndarray,
+    tpr: np.ndarray,
+    fpr: np.ndarray,
+    thresholds: np.ndarray,
+    threshold: float,
+    area: bool = False,
+    auc: Optional[float] = None,
+    key: Optional[str] = None,
+) -> np.ndarray:
+    fig = build_fig2(probabilities, labels, tpr, fpr, area=area, auc=auc)
+    fig.layout.shapes[0].update(x0=threshold, x1=threshold)
 
+    i = threshold_index(thresholds, threshold)
     fig.add_annotation(
-        x=fpr[int(threshold * 10)],
-        y=tpr[int(threshold * 10)],
+        x=fpr[i],
+        y=tpr[i],
         ax=0,
         ay=-40,
         text=f"threshold={threshold}",
@@ -187,4 +256,4 @@ def plot2(
         row=2,
         col=1,
     )
-    st.plotly_chart(fig)
+    st.plotly_chart(fig, key=key, use_container_width=True)